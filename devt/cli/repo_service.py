@@ -7,6 +7,7 @@ Tool Service Commands
 Provides commands to import, export, update, and remove tool packages.
 """
 
+import concurrent.futures
 import logging
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -35,7 +36,7 @@ class RepoService:
     def __init__(self, registry_dir: Path) -> None:
         self.registry = RegistryManager(registry_dir)
         self.tool_service = ToolService(registry_dir)
-        self.repo_manager = RepoManager()
+        self.repo_manager = RepoManager.get()
         self.sync_manager = SyncManager(registry_dir)
 
     # -------------------------------------------
@@ -91,8 +92,14 @@ class RepoService:
             logger.info("No repositories found to sync.")
             raise ValueError("No repositories found to sync.")
 
-        for repo in repos:
-            self.sync_manager.sync_single_repository(repo, force)
+        # Each sync waits on the network, so run them side by side.
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(self.sync_manager.sync_single_repository, repo, force)
+                for repo in repos
+            ]
+            for future in futures:
+                future.result()
 
     def list_repos(self, **filters: Dict[str, Optional[str]]) -> List[Dict[str, Any]]:
         """Returns a list of all repositories in the registry."""
@@ -30,7 +30,7 @@ class SyncManager:
     def __init__(self, registry_dir: Path) -> None:
         self.registry = RegistryManager(registry_dir)
         self.tool_service = ToolService(registry_dir)
-        self.repo_manager = RepoManager()
+        self.repo_manager = RepoManager.get()
         self.last_sync_time = 0
 
     def sync_single_repository(self, repo: dict, force: bool = False) -> None:
@@ -11,25 +11,39 @@ Provides generic helpers for:
   - Resolving and validating release versions via the GitHub API
 """
 
+from functools import lru_cache
 import platform
 import ssl
 import json
 import logging
 from pathlib import Path
 
-import urllib3
-import truststore
 from packaging import version as pkg_version
 
 logger = logging.getLogger(__name__)
 
-# Setup SSL context and HTTP manager (shared across functions)
-ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-http = urllib3.PoolManager(ssl_context=ssl_context)
+
+@lru_cache(maxsize=None)
+def get_http():
+    """
+    Return the HTTP manager shared across functions, creating it on first use.
+
+    urllib3 and truststore are imported here so that commands which never go
+    online do not pay for them, or for building the SSL context, at startup.
+    """
+    import truststore
+    import urllib3
+
+    ssl_context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    return urllib3.PoolManager(ssl_context=ssl_context)
+
 
 # Base URL for GitHub releases for DevT
 GITHUB_API_BASE = "https://api.github.com/repos/dkuwcreator/devt/releases"
 
+# Bytes read from the network and written to disk per step while downloading
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 def get_os_key() -> str:
     """
@@ -66,7 +80,9 @@ def fetch_json(url: str, timeout_connect: float = 10.0, timeout_read: float = 10
     Returns a dictionary or an empty dict if an error occurs.
     """
     try:
-        response = http.request(
+        import urllib3
+
+        response = get_http().request(
             "GET",
             url,
             timeout=urllib3.Timeout(connect=timeout_connect, read=timeout_read)
@@ -87,21 +103,37 @@ def download_file(download_url: str, save_path: Path, timeout_connect: float = 1
     Returns True on success, False otherwise.
     """
     logger.info("Starting download from %s", download_url)
+    response = None
     try:
-        response = http.request(
+        import urllib3
+
+        # Stream the body to disk so an executable of tens of MB is never held
+        # in memory as a whole.
+        response = get_http().request(
             "GET",
             download_url,
+            preload_content=False,
             timeout=urllib3.Timeout(connect=timeout_connect, read=timeout_read)
         )
         if response.status != 200:
             logger.error("Non-200 response while downloading '%s': %s", download_url, response.status)
             return False
-        save_path.write_bytes(response.data)
+        try:
+            with save_path.open("wb") as f:
+                for chunk in response.stream(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        except BaseException:
+            # Do not leave a truncated file behind.
+            save_path.unlink(missing_ok=True)
+            raise
         logger.info("Downloaded file saved to %s", save_path)
         return True
     except Exception as err:
         logger.error("Error downloading %s: %s", getattr(save_path, 'name', save_path), err)
         return False
+    finally:
+        if response is not None:
+            response.release_conn()
 
 
 def resolve_version(version_str: str = "latest") -> str:
@@ -13,6 +13,7 @@ import sys
 import subprocess
 import logging
 import os
+import time
 from pathlib import Path
 
 import typer
@@ -26,6 +27,10 @@ logger = logging.getLogger(__name__)
 TIMEOUT_CONNECT = 10.0
 TIMEOUT_READ = 30.0
 
+# Retries for swapping in the new executable while the old process exits.
+REPLACE_ATTEMPTS = 30
+REPLACE_RETRY_DELAY = 0.1
+
 def get_download_url(version: str) -> str:
     """
     Build the download URL using the provided version and OS key.
@@ -50,6 +55,30 @@ def download_executable(url: str, destination: Path) -> bool:
     return True
 
 
+def install_executable(url: str, destination: Path) -> bool:
+    """
+    Download the executable next to the destination and move it into place.
+
+    The old executable stays intact until the download has completed, and the
+    swap is a single atomic rename. On Windows the rename fails while the old
+    DevT process still holds its file, so it is retried briefly.
+    """
+    download_path = destination.with_name(destination.name + ".download")
+    if not download_executable(url, download_path):
+        return False
+    if platform.system() != "Windows":
+        download_path.chmod(download_path.stat().st_mode | 0o111)
+    for _ in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(download_path, destination)
+            return True
+        except PermissionError:
+            time.sleep(REPLACE_RETRY_DELAY)
+    logger.error("Could not replace %s; it is still in use.", destination)
+    download_path.unlink(missing_ok=True)
+    return False
+
+
 def restart_application(executable: Path) -> None:
     """
     Restart the installed application (e.g. to verify the new version).
@@ -183,8 +212,8 @@ def install(
     install_dir.mkdir(parents=True, exist_ok=True)
     typer.echo(f"Installing DevT to {install_dir}...")
     
-    # Download the executable.
-    if not download_executable(download_url, current_executable):
+    # Download the executable and swap it in for any existing copy.
+    if not install_executable(download_url, current_executable):
         logger.error("Download failed. Exiting.")
         sys.exit(1)
         
@@ -183,5 +183,7 @@ class PackageBuilder:
             install_date=datetime.now().isoformat(),
             last_update=datetime.now().isoformat(),
         )
-        logger.debug("Built package: %s", package.to_dict())
+        if logger.isEnabledFor(logging.DEBUG):
+            # to_dict serializes every script, so only pay for it when logged.
+            logger.debug("Built package: %s", package.to_dict())
         return package
@@ -106,8 +106,12 @@ class Script:
         self.shell = shell
         self.cwd = self._map_cwd(cwd)
         self.env = env or {}
-        # Filter kwargs based on allowed keys
-        self.kwargs = {k: v for k, v in kwargs.items() if k in SUBPROCESS_ALLOWED_KEYS}
+        # Filter kwargs based on allowed keys; **kwargs is already a fresh dict,
+        # so it is kept as is when every key is allowed (the common case).
+        if kwargs.keys() <= SUBPROCESS_ALLOWED_KEYS:
+            self.kwargs = kwargs
+        else:
+            self.kwargs = {k: v for k, v in kwargs.items() if k in SUBPROCESS_ALLOWED_KEYS}
         logger.debug("Script instance created: %s", self.__dict__)
 
     def _map_cwd(self, cwd_value: Union[Path, str]) -> Path:
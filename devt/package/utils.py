@@ -7,14 +7,36 @@ Utility functions for package management.
 Provides functions to load and validate manifest files, build command tokens,
 and merge global and script configurations.
 """
+import copy
+from functools import lru_cache
 import logging
+import os
 import shlex
 import shutil
 from pathlib import Path
+from typing import Optional
 from devt.utils import load_manifest, validate_manifest, merge_configs
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=4096)
+def _cached_which(cmd: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(cmd, path=path)
+
+
+def which(cmd: str) -> Optional[str]:
+    """
+    shutil.which, memoized per command name and PATH value.
+
+    Commands containing a directory part are resolved against the current
+    directory, so they are looked up uncached.
+    """
+    if os.path.dirname(cmd):
+        return shutil.which(cmd)
+    return _cached_which(cmd, os.environ.get("PATH"))
+
+
 def needs_shell_fallback(args, posix: bool) -> bool:
     """
     Determine whether the given command requires a shell fallback.
@@ -23,15 +45,15 @@ def needs_shell_fallback(args, posix: bool) -> bool:
     if isinstance(args, list):
         first_arg = args[0]
     else:
-        first_arg = shlex.split(args, posix=posix)[0]
+        first_arg = _split(args, posix)[0]
     logger.debug("First argument resolved to: %s", first_arg)
-    which_result = shutil.which(first_arg)
+    which_result = which(first_arg)
     # Exclude executables from a local virtual environment (e.g., containing ".venv")
     if which_result and ".venv" in which_result:
         logger.debug("Excluding local virtual environment executable: %s", which_result)
         return True
     
-    logger.debug("shutil.which(%s) returned: %s", first_arg, which_result)
+    logger.debug("which(%s) returned: %s", first_arg, which_result)
     return which_result is None
 
 
@@ -42,7 +64,7 @@ def default_shell_prefix(command: str, is_windows: bool) -> list:
     if is_windows:
         if "\n" in command and not command.strip().startswith("& {"):
                 command = f"{{\n{command}\n}}"
-        if shutil.which("pwsh"):
+        if which("pwsh"):
             return ["pwsh", "-Command", f"& {command}"]
         else:
             return ["powershell", "-Command", f"& {command}"]
@@ -50,6 +72,15 @@ def default_shell_prefix(command: str, is_windows: bool) -> list:
         return ["bash", "-c", command]
 
 
+@lru_cache(maxsize=1024)
+def _split(command: str, posix: bool) -> tuple:
+    """
+    shlex.split, memoized. A script's command string is tokenized by both the
+    fallback check and the token builder, and again on a fallback run.
+    """
+    return tuple(shlex.split(command, posix=posix))
+
+
 def to_tokens(val, *, posix: bool, split: bool = True) -> list:
     """
     Normalize a value into a list of tokens.
@@ -59,7 +90,7 @@ def to_tokens(val, *, posix: bool, split: bool = True) -> list:
         return []
     if isinstance(val, list):
         return val
-    return shlex.split(val, posix=posix) if split else [val]
+    return list(_split(val, posix)) if split else [val]
 
 
 def build_command_tokens(
@@ -90,16 +121,36 @@ def build_command_tokens(
         return main_tokens + extra_tokens
 
 
-def load_and_validate_manifest(manifest_path: Path) -> dict:
+@lru_cache(maxsize=512)
+def _cached_manifest(path_str: str, mtime_ns: int, size: int) -> dict:
     """
-    Load and validate a manifest file.
+    Load and validate a manifest file, memoized on its path and stat signature.
+
+    Editing the file changes its mtime or size, which misses the cache.
     """
+    manifest_path = Path(path_str)
     manifest = load_manifest(manifest_path)
     if not validate_manifest(manifest):
         raise ValueError(f"Invalid manifest file at {manifest_path}")
     return manifest
 
 
+def load_and_validate_manifest(manifest_path: Path) -> dict:
+    """
+    Load and validate a manifest file.
+    """
+    if not manifest_path.is_file():
+        # Directories are searched for a manifest by load_manifest itself.
+        manifest = load_manifest(manifest_path)
+        if not validate_manifest(manifest):
+            raise ValueError(f"Invalid manifest file at {manifest_path}")
+        return manifest
+    stat = manifest_path.stat()
+    manifest = _cached_manifest(str(manifest_path), stat.st_mtime_ns, stat.st_size)
+    # Callers own the returned manifest, so hand out a copy of the cached one.
+    return copy.deepcopy(manifest)
+
+
 def merge_global_and_script_configs(
     manifest: dict, subprocess_allowed_keys: set
 ) -> dict:
@@ -7,47 +7,335 @@ Manages database operations for the DevT registry, including scripts, packages,
 """
 
 from contextlib import contextmanager
+import copy
 from datetime import datetime
+from functools import lru_cache
 import logging
+from itertools import chain, groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Generator
+import sqlite3
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Generator, Mapping, Union
+
+from sqlalchemy import (
+    bindparam,
+    column,
+    create_engine,
+    delete,
+    event,
+    exists,
+    insert,
+    select,
+    table,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from devt.registry.models import Base, ScriptModel, PackageModel, RepositoryModel, dump_json
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+logger = logging.getLogger(__name__)
 
-from devt.registry.models import Base, ScriptModel, PackageModel, RepositoryModel
 
-logger = logging.getLogger(__name__)
+def _now_us() -> int:
+    """Current time as Unix microseconds, the storage format of timestamp columns."""
+    return time.time_ns() // 1000
+
+
+# Datetimes are immutable and recur across rows, so their ISO form is memoized.
+_isoformat = lru_cache(maxsize=4096)(datetime.isoformat)
+
+
+class ReadCache:
+    """
+    Read-through cache for registry lookups.
+
+    One instance is shared by every engine bound to the same database and is
+    cleared whenever any of them writes. Values are copied on the way in and
+    out, so callers may mutate what they receive.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[tuple, Any] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, loader: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                return copy.deepcopy(self._entries[key])
+            generation = self._generation
+        value = loader()
+        with self._lock:
+            # Skip the store if a write happened while the value was loading.
+            if generation == self._generation:
+                self._entries[key] = copy.deepcopy(value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+
+_read_caches: Dict[str, ReadCache] = {}
+_read_caches_lock = threading.Lock()
+
+
+def get_read_cache(engine: Any) -> ReadCache:
+    """
+    Returns the read cache shared by all engines on the engine's database.
+    """
+    key = str(engine.url)
+    with _read_caches_lock:
+        cache = _read_caches.get(key)
+        if cache is None:
+            cache = _read_caches[key] = ReadCache()
+    return cache
+
+
+def _clear_cache_on_write(engine: Any) -> None:
+    """
+    Clears the shared read cache when DML runs on the engine, and again when
+    the writing transaction ends.
+    """
+    cache = get_read_cache(engine)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_execute(conn, cursor, statement, parameters, context, executemany):
+        if context.isinsert or context.isupdate or context.isdelete:
+            conn.info["registry_written"] = True
+            cache.clear()
+
+    @event.listens_for(engine, "commit")
+    @event.listens_for(engine, "rollback")
+    def _after_transaction(conn):
+        if conn.info.pop("registry_written", False):
+            cache.clear()
+
+
+# Applied to every new SQLite connection. WAL lets readers run alongside a writer
+# and, with synchronous=NORMAL, drops the fsync from each commit. In WAL mode
+# SQLite keeps registry.db-wal and registry.db-shm next to the database; they
+# belong to it and must be copied or removed together with registry.db.
+# page_size only takes effect on a database that has no tables yet, so it must
+# run before journal_mode; on existing files it is a no-op.
+SQLITE_PRAGMAS = (
+    "PRAGMA page_size=8192",
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=1073741824",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA foreign_keys=ON",
+)
+
+
+def _apply_pragmas(engine: Any) -> None:
+    """
+    Issues SQLITE_PRAGMAS on each connection the engine opens.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        try:
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def _create_missing_indexes(engine: Any) -> None:
+    """
+    Creates indexes declared on the models that an existing database lacks.
+
+    create_all() skips tables that already exist, indexes included, so
+    registries created before an index was added would otherwise never get it.
+    """
+    for table_ in Base.metadata.sorted_tables:
+        for index in table_.indexes:
+            index.create(engine, checkfirst=True)
+
+
+def _migrate_scripts_foreign_key(engine: Any) -> None:
+    """
+    Rebuilds a scripts table created before it referenced packages.
+
+    SQLite cannot add a foreign key to an existing table, so the rows are copied
+    into a freshly created one. Scripts whose package no longer exists are
+    unreachable and are dropped along the way.
+    """
+    columns = ", ".join(c.name for c in ScriptModel.__table__.c)
+    with engine.begin() as conn:
+        if conn.exec_driver_sql("PRAGMA foreign_key_list(scripts)").first():
+            return
+        conn.exec_driver_sql("ALTER TABLE scripts RENAME TO scripts_old")
+        ScriptModel.__table__.create(conn)
+        total = conn.exec_driver_sql("SELECT count(*) FROM scripts_old").scalar()
+        kept = conn.exec_driver_sql(
+            f"INSERT INTO scripts ({columns}) SELECT {columns} FROM scripts_old "
+            "WHERE command IN (SELECT command FROM packages)"
+        ).rowcount
+        conn.exec_driver_sql("DROP TABLE scripts_old")
+    logger.info("Migrated scripts table to cascade deletes from packages.")
+    if total != kept:
+        logger.warning(
+            "Dropped %d script(s) whose package no longer exists while migrating.",
+            total - kept,
+        )
 
 
 def create_db_engine(registry_dir: Path) -> Any:
     """
     Creates and initializes the database engine.
+
+    The database runs in WAL mode, so registry_dir also holds the
+    registry.db-wal and registry.db-shm sidecar files while it is in use.
     """
     registry_dir.mkdir(exist_ok=True)
     db_file = (registry_dir / "registry.db").resolve()
     db_uri = f"sqlite:///{db_file}"
-    engine = create_engine(db_uri, echo=False, future=True)
+    # File databases get a QueuePool; connections may then hop threads, and the
+    # busy timeout lets concurrent writers wait for the lock instead of failing.
+    engine = create_engine(
+        db_uri,
+        echo=False,
+        future=True,
+        query_cache_size=1200,
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        connect_args={"check_same_thread": False, "timeout": 30},
+    )
+    _apply_pragmas(engine)
+    _clear_cache_on_write(engine)
     Base.metadata.create_all(engine)
+    _migrate_scripts_foreign_key(engine)
+    _create_missing_indexes(engine)
     logger.debug(f"Registry initialized with database at {db_file}")
     return engine
 
 
-@contextmanager
-def session_scope(Session) -> Generator[Any, None, None]:
+# Full-text index mirroring the searchable package columns. The trigram tokenizer
+# keeps the substring semantics of LIKE '%...%' for terms of three or more characters.
+PACKAGES_FTS = table(
+    "packages_fts",
+    column("command"),
+    column("name"),
+    column("description"),
+    column("location"),
+)
+FTS_MIN_TERM_LENGTH = 3
+
+# Number of rows fetched per round trip when streaming listings.
+YIELD_PER = 100
+
+# Keys per IN (...) list, kept under SQLite's historical 999 bound-parameter limit.
+IN_CHUNK_SIZE = 900
+
+# Packed field layouts; attrgetter reads them from ORM instances and rows alike.
+PACKAGE_FIELDS = (
+    "command",
+    "name",
+    "description",
+    "location",
+    "dependencies",
+    "group",
+    "active",
+    "install_date",
+    "last_update",
+)
+REPOSITORY_FIELDS = (
+    "url",
+    "name",
+    "branch",
+    "location",
+    "auto_sync",
+    "install_date",
+    "last_update",
+)
+_get_package_fields = attrgetter(*PACKAGE_FIELDS)
+_get_repository_fields = attrgetter(*REPOSITORY_FIELDS)
+_FTS_COLUMNS = "command, name, description, location"
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS packages_fts USING fts5("
+    "command UNINDEXED, name, description, location, tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS packages_fts_ai AFTER INSERT ON packages BEGIN "
+    f"INSERT INTO packages_fts({_FTS_COLUMNS}) "
+    "VALUES (new.command, new.name, new.description, new.location); END",
+    "CREATE TRIGGER IF NOT EXISTS packages_fts_ad AFTER DELETE ON packages BEGIN "
+    "DELETE FROM packages_fts WHERE command = old.command; END",
+    "CREATE TRIGGER IF NOT EXISTS packages_fts_au "
+    "AFTER UPDATE OF command, name, description, location ON packages BEGIN "
+    "DELETE FROM packages_fts WHERE command = old.command; "
+    f"INSERT INTO packages_fts({_FTS_COLUMNS}) "
+    "VALUES (new.command, new.name, new.description, new.location); END",
+)
+
+
+# Whether each engine's database has a usable search index, so registries
+# built after the first one on an engine skip the check entirely.
+_search_index_state: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+
+
+def create_search_index(engine: Any) -> bool:
     """
-    Provides a transactional scope for a series of operations.
+    Creates the FTS5 search index over packages and its sync triggers.
+
+    The index is looked up with a plain read first; the DDL and backfill run in
+    a write transaction only when it is missing. Returns False when the SQLite
+    build lacks FTS5 or the trigram tokenizer, in which case callers fall back
+    to LIKE filters.
     """
-    session = Session()
+    state = _search_index_state.get(engine)
+    if state is not None:
+        return state
+    with engine.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE name = 'packages_fts'")
+        ).first()
+    if exists:
+        _search_index_state[engine] = True
+        return True
     try:
-        yield session
-        session.commit()
-    except Exception as exc:
-        session.rollback()
-        logger.error("Session rollback due to exception: %s", exc)
-        raise exc
-    finally:
-        session.close()
+        with engine.begin() as conn:
+            for ddl in _FTS_DDL:
+                conn.execute(text(ddl))
+            conn.execute(
+                text(
+                    f"INSERT INTO packages_fts({_FTS_COLUMNS}) "
+                    f"SELECT {_FTS_COLUMNS} FROM packages"
+                )
+            )
+    except OperationalError as exc:
+        logger.debug("Full-text search unavailable, using LIKE filters: %s", exc)
+        state = False
+    else:
+        state = True
+    _search_index_state[engine] = state
+    return state
+
+
+def drop_search_index(engine: Any) -> None:
+    """
+    Drops the FTS5 search index over packages.
+    """
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS packages_fts"))
+    _search_index_state.pop(engine, None)
+
+
+def _fts_phrase(value: str) -> str:
+    """Quotes a search term as a single FTS5 phrase."""
+    return '"' + value.replace('"', '""') + '"'
 
 
 class BaseRegistry:
@@ -55,9 +343,111 @@ class BaseRegistry:
     Base class for registry management.
     """
 
+    model: Any = None
+    # Reported as ValueError when a row references a missing parent row.
+    missing_parent_message: Optional[str] = None
+
     def __init__(self, engine: Any) -> None:
         self.engine = engine
-        self.Session = sessionmaker(bind=self.engine, future=True)
+        self.Session = scoped_session(
+            sessionmaker(
+                bind=self.engine, future=True, expire_on_commit=False, autoflush=False
+            )
+        )
+        self._list_statements: Dict[tuple, Any] = {}
+        self.read_cache = get_read_cache(engine)
+
+    @contextmanager
+    def _session(self, commit: bool = False) -> Generator[Any, None, None]:
+        """
+        Yields the thread's session and commits once at the end if requested.
+
+        Nested blocks share the outermost block's transaction; only the
+        outermost one commits, rolls back and releases the session.
+        """
+        session = self.Session()
+        outermost = not session.info.get("in_use")
+        session.info["in_use"] = True
+        try:
+            yield session
+            if commit and outermost:
+                session.commit()
+        except Exception as exc:
+            if outermost:
+                session.rollback()
+                logger.error("Session rollback due to exception: %s", exc)
+            raise
+        finally:
+            if outermost:
+                self.Session.remove()
+
+    def _filter_clause(self, key: str, mode: str) -> Any:
+        """
+        Builds the WHERE clause for a filter, bound to a parameter named after it.
+        """
+        attr = getattr(self.model, key)
+        if mode == "like":
+            return attr.like(bindparam(key))
+        return attr == bindparam(key)
+
+    def _insert(
+        self, session: Any, values: Union[Dict[str, Any], List[Dict[str, Any]]], exists_message: str
+    ) -> None:
+        """
+        Inserts a row with a Core INSERT, reporting a primary key clash or a
+        missing parent row as ValueError.
+
+        A list of rows is sent as a single executemany INSERT.
+        """
+        try:
+            if isinstance(values, list):
+                session.execute(insert(self.model), values)
+            else:
+                session.execute(insert(self.model).values(**values))
+        except IntegrityError as exc:
+            self._raise_integrity_error(exc.orig, exists_message)
+
+    def _raise_integrity_error(self, error: Exception, exists_message: str) -> None:
+        """
+        Re-raises a UNIQUE or FOREIGN KEY failure as ValueError, anything else as is.
+        """
+        if "UNIQUE" in str(error):
+            raise ValueError(exists_message) from error
+        if "FOREIGN KEY" in str(error) and self.missing_parent_message:
+            raise ValueError(self.missing_parent_message) from error
+        raise error
+
+    def _update_many(self, key_column: Any, keys: Iterable[str], values: Dict[str, Any]) -> int:
+        """
+        Applies the same values to every row whose key is listed, in one
+        transaction, and returns the number of rows changed.
+        """
+        keys = list(keys)
+        updated = 0
+        with self._session(commit=True) as session:
+            for start in range(0, len(keys), IN_CHUNK_SIZE):
+                result = session.execute(
+                    update(self.model)
+                    .where(key_column.in_(keys[start : start + IN_CHUNK_SIZE]))
+                    .values(**values)
+                )
+                updated += result.rowcount
+        return updated
+
+    def _list_statement(self, filters: tuple) -> Any:
+        """
+        Returns the SELECT for a combination of active (key, mode) filters.
+
+        Each combination is built once and then reused with bound parameters.
+        Plain table columns are selected so rows skip ORM instance construction.
+        """
+        stmt = self._list_statements.get(filters)
+        if stmt is None:
+            stmt = select(*self.model.__table__.c).where(
+                *(self._filter_clause(key, mode) for key, mode in filters)
+            )
+            self._list_statements[filters] = stmt
+        return stmt
 
 
 class ScriptRegistry(BaseRegistry):
@@ -65,131 +455,428 @@ class ScriptRegistry(BaseRegistry):
     Manages all script-related operations.
     """
 
-    def _unpack_script_data(self, script: dict) -> dict:
+    model = ScriptModel
+    missing_parent_message = "Package not found"
+
+    # Statements built once and executed with bound parameters. Reads select
+    # plain table columns so rows skip ORM instance construction.
+    _get_stmt = select(*ScriptModel.__table__.c).where(
+        ScriptModel.command == bindparam("command"),
+        ScriptModel.script_name == bindparam("script_name"),
+    )
+    _delete_stmt = delete(ScriptModel).where(
+        ScriptModel.command == bindparam("command"),
+        ScriptModel.script_name == bindparam("script_name"),
+    )
+    # Ordered by the second primary key column, so SQLite walks the
+    # (command, script_name) index in order without a sort step.
+    _by_command_stmt = (
+        select(*ScriptModel.__table__.c)
+        .where(ScriptModel.command == bindparam("command"))
+        .order_by(ScriptModel.script_name)
+    )
+
+    def _unpack_script_data(self, script: Mapping[str, Any]) -> dict:
         if "args" not in script:
             raise ValueError("Missing required key 'args' in script configuration.")
-        script.setdefault("cwd", ".")
         return {
             "args": script["args"],
-            "cwd": str(script["cwd"]),
+            "cwd": script.get("cwd", "."),
             "env": script.get("env"),
             "shell": script.get("shell"),
             "kwargs": script.get("kwargs"),
         }
 
-    def _pack_script_data(self, script: ScriptModel) -> dict:
+    @staticmethod
+    def _pack_script_data(script: Any) -> dict:
         return {
             "command": script.command,
             "script_name": script.script_name,
             "args": script.args,
-            "cwd": str(Path(script.cwd)),
+            "cwd": script.cwd,
             "env": script.env,
             "shell": script.shell,
             "kwargs": script.kwargs,
         }
 
     def add_script(self, command: str, script_name: str, script: dict, force: bool = False) -> None:
-        script_data = self._unpack_script_data(script)
-
-        with session_scope(self.Session) as session:
-            existing_script = session.query(ScriptModel).filter_by(command=command, script_name=script_name).first()
-            if existing_script:
-                if force:
-                    session.delete(existing_script)
-                    logger.info("Existing script '%s' deleted for command '%s'.", script_name, command)
-                else:
-                    raise ValueError("Script already exists. Use --force to overwrite.")
-            session.add(ScriptModel(command=command, script_name=script_name, **script_data))
-            logger.debug("Script '%s' added for command '%s'.", script_name, command)
+        with self._session(commit=True) as session:
+            self.insert_scripts(session, command, {script_name: script}, force=force)
+
+    def insert_scripts(
+        self, session: Any, command: str, scripts: Mapping[str, Any], force: bool = False
+    ) -> None:
+        """
+        Inserts the scripts of a package in the caller's session with one executemany.
+        """
+        rows = [
+            {"command": command, "script_name": script_name, **self._unpack_script_data(script)}
+            for script_name, script in scripts.items()
+        ]
+        if not rows:
+            return
+        if force:
+            result = session.execute(
+                delete(ScriptModel).where(
+                    ScriptModel.command == command,
+                    ScriptModel.script_name.in_(list(scripts)),
+                )
+            )
+            if result.rowcount:
+                logger.info("Existing script(s) deleted for command '%s': %d", command, result.rowcount)
+        self._insert(session, rows, "Script already exists. Use --force to overwrite.")
+        logger.debug("Script(s) %s added for command '%s'.", list(scripts), command)
+
+    def bulk_add_scripts(self, rows: List[Mapping[str, Any]]) -> None:
+        """
+        Adds scripts of any packages in one transaction with a single executemany.
+
+        Each row holds the script configuration plus its 'command' and 'script_name'.
+        """
+        values = [
+            {
+                "command": row["command"],
+                "script_name": row["script_name"],
+                **self._unpack_script_data(row),
+            }
+            for row in rows
+        ]
+        if not values:
+            return
+        with self._session(commit=True) as session:
+            self._insert(session, values, "Script already exists. Use --force to overwrite.")
+        logger.debug("Bulk added %d script(s).", len(values))
 
     def get_script(self, command: str, script_name: str) -> Optional[dict]:
-        with self.Session() as session:
-            result = (
-                session.query(ScriptModel)
-                .filter_by(command=command, script_name=script_name)
-                .first()
-            )
+        with self._session() as session:
+            result = session.execute(
+                self._get_stmt, {"command": command, "script_name": script_name}
+            ).first()
             return self._pack_script_data(result) if result else None
 
+    def bulk_import_scripts(self, rows: List[Mapping[str, Any]]) -> None:
+        """
+        Imports scripts with a DBAPI executemany, bypassing SQLAlchemy's
+        statement and type processing. Meant for one-shot registry population.
+
+        Each row holds the script configuration plus its 'command' and 'script_name'.
+        """
+        params = [
+            (
+                row["command"],
+                row["script_name"],
+                dump_json(row["args"]),
+                str(Path(row.get("cwd", "."))),
+                dump_json(row.get("env")),
+                row.get("shell"),
+                dump_json(row.get("kwargs")),
+            )
+            for row in rows
+        ]
+        if not params:
+            return
+        columns = ", ".join(c.name for c in ScriptModel.__table__.c)
+        sql = f"INSERT INTO scripts ({columns}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+        conn = self.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(sql, params)
+            conn.commit()
+        except sqlite3.IntegrityError as exc:
+            conn.rollback()
+            self._raise_integrity_error(exc, "Script already exists. Use --force to overwrite.")
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        # Raw DBAPI writes bypass the engine events that clear the read cache.
+        self.read_cache.clear()
+        logger.debug("Imported %d script(s).", len(params))
+
+    def upsert_script(self, command: str, script_name: str, script: Mapping[str, Any]) -> None:
+        """
+        Adds the script, or overwrites its configuration if it already exists.
+        """
+        values = {"command": command, "script_name": script_name, **self._unpack_script_data(script)}
+        stmt = sqlite_insert(ScriptModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["command", "script_name"],
+            set_={key: stmt.excluded[key] for key in values if key not in ("command", "script_name")},
+        )
+        with self._session(commit=True) as session:
+            try:
+                session.execute(stmt)
+            except IntegrityError as exc:
+                self._raise_integrity_error(exc.orig, "Script already exists.")
+
+    def batch_get_scripts(self, pairs: List[tuple]) -> Dict[tuple, dict]:
+        """
+        Fetches several scripts in as few queries as possible, keyed by
+        (command, script_name).
+
+        Pairs with no matching script are left out of the result.
+        """
+        pairs = list(pairs)
+        # Each pair binds two parameters.
+        chunk_size = IN_CHUNK_SIZE // 2
+        scripts: Dict[tuple, dict] = {}
+        with self._session() as session:
+            for start in range(0, len(pairs), chunk_size):
+                stmt = select(*ScriptModel.__table__.c).where(
+                    tuple_(ScriptModel.command, ScriptModel.script_name).in_(
+                        pairs[start : start + chunk_size]
+                    )
+                )
+                for row in session.execute(stmt):
+                    scripts[(row.command, row.script_name)] = self._pack_script_data(row)
+        return scripts
+
+    def iter_scripts(self, command: str) -> Iterator[dict]:
+        """
+        Yields the scripts of a package, fetching rows in batches.
+        """
+        # Streaming holds its session open between yields, so it gets its own.
+        with self.Session.session_factory() as session:
+            for script in session.execute(
+                self._by_command_stmt,
+                {"command": command},
+                execution_options={"yield_per": YIELD_PER},
+            ):
+                yield self._pack_script_data(script)
+
     def list_scripts(self, command: str) -> List[dict]:
-        with self.Session() as session:
-            results = session.query(ScriptModel).filter_by(command=command).all()
-            return [self._pack_script_data(s) for s in results]
+        return list(self.iter_scripts(command))
 
     def update_script(self, command: str, script_name: str, script: dict) -> None:
         script_data = self._unpack_script_data(script)
-        with session_scope(self.Session) as session:
-            instance = (
-                session.query(ScriptModel)
-                .filter_by(command=command, script_name=script_name)
-                .first()
+        with self._session(commit=True) as session:
+            result = session.execute(
+                update(ScriptModel)
+                .where(
+                    ScriptModel.command == command,
+                    ScriptModel.script_name == script_name,
+                )
+                .values(**script_data)
             )
-            if not instance:
+            if result.rowcount == 0:
                 raise ValueError("Script not found")
-            instance.args = script_data["args"]
-            instance.cwd = script_data["cwd"]
-            instance.env = script_data["env"]
-            instance.shell = script_data["shell"]
-            instance.kwargs = script_data["kwargs"]
 
     def delete_script(self, command: str, script_name: str) -> None:
-        with session_scope(self.Session) as session:
-            instance = (
-                session.query(ScriptModel)
-                .filter_by(command=command, script_name=script_name)
-                .first()
+        with self._session(commit=True) as session:
+            result = session.execute(
+                self._delete_stmt, {"command": command, "script_name": script_name}
             )
-            if instance:
-                session.delete(instance)
+            if result.rowcount:
                 logger.debug(
                     "Deleted script '%s' for command '%s'.", script_name, command
                 )
 
+    def bulk_remove_scripts(self, commands: List[str]) -> int:
+        """
+        Deletes every script of the given packages in one transaction.
+
+        Returns the number of scripts removed.
+        """
+        commands = list(commands)
+        removed = 0
+        with self._session(commit=True) as session:
+            for start in range(0, len(commands), IN_CHUNK_SIZE):
+                result = session.execute(
+                    delete(ScriptModel).where(
+                        ScriptModel.command.in_(commands[start : start + IN_CHUNK_SIZE])
+                    )
+                )
+                removed += result.rowcount
+        logger.debug("Removed %d script(s) for %d command(s).", removed, len(commands))
+        return removed
+
 
 class PackageRegistry(BaseRegistry):
     """
     Manages all package-related operations.
     """
 
-    def _pack_package_data(self, package: PackageModel) -> Dict[str, Any]:
-        return {
-            "command": package.command,
-            "name": package.name,
-            "description": package.description,
-            "location": package.location,
-            "dependencies": (
-                package.dependencies if package.dependencies is not None else {}
-            ),
-            "group": package.group,
-            "active": package.active,
-            "install_date": package.install_date.isoformat(),
-            "last_update": package.last_update.isoformat(),
-        }
+    model = PackageModel
+
+    # Statements built once and executed with bound parameters. Reads select
+    # plain table columns so rows skip ORM instance construction.
+    _get_stmt = select(*PackageModel.__table__.c).where(
+        PackageModel.command == bindparam("command")
+    )
+    _location_stmt = select(PackageModel.location).where(
+        PackageModel.command == bindparam("command")
+    )
+    _delete_stmt = delete(PackageModel).where(PackageModel.command == bindparam("command"))
+
+    def __init__(self, engine: Any) -> None:
+        super().__init__(engine)
+        self.search_index = create_search_index(engine)
+
+    def _filter_clause(self, key: str, mode: str) -> Any:
+        if mode == "match":
+            matches = select(PACKAGES_FTS.c.command).where(
+                PACKAGES_FTS.c[key].op("MATCH")(bindparam(key))
+            )
+            return PackageModel.command.in_(matches)
+        return super()._filter_clause(key, mode)
+
+    def _text_filter(self, value: str) -> tuple:
+        """
+        Returns the (mode, parameter) of a substring filter, served by the
+        FTS5 index when possible.
+        """
+        if self.search_index and len(value) >= FTS_MIN_TERM_LENGTH:
+            return "match", _fts_phrase(value)
+        return "like", f"%{value}%"
+
+    def _pack_package_data(self, package: Any) -> Dict[str, Any]:
+        """Packs a PackageModel instance or a packages table row."""
+        data = dict(zip(PACKAGE_FIELDS, _get_package_fields(package)))
+        if data["dependencies"] is None:
+            data["dependencies"] = {}
+        data["install_date"] = _isoformat(data["install_date"])
+        data["last_update"] = _isoformat(data["last_update"])
+        return data
 
     def add_package(self, **kwargs: Any) -> None:
-        now_dt = datetime.now()
-        kwargs["install_date"] = now_dt
-        kwargs["last_update"] = now_dt
+        with self._session(commit=True) as session:
+            self.insert_package(session, **kwargs)
+
+    def insert_package(self, session: Any, **kwargs: Any) -> None:
+        """
+        Inserts a package row in the caller's session.
+        """
+        now_us = _now_us()
+        kwargs["install_date"] = now_us
+        kwargs["last_update"] = now_us
 
         command = kwargs.get("command")
         force = kwargs.pop("force", False)
 
-        with session_scope(self.Session) as session:
-            existing_pkg = session.query(PackageModel).filter_by(command=command).first()
-            if existing_pkg:
-                if force:
-                    session.delete(existing_pkg)
-                    logger.info("Existing package '%s' deleted.", command)
-                else:
-                    raise ValueError("Package already exists. Use --force to overwrite.")
-            session.add(PackageModel(**kwargs))
-            logger.debug("Package '%s' added.", command)
+        if force:
+            result = session.execute(
+                delete(PackageModel).where(PackageModel.command == command)
+            )
+            if result.rowcount:
+                logger.info("Existing package '%s' deleted.", command)
+        self._insert(
+            session, kwargs, "Package already exists. Use --force to overwrite."
+        )
+        logger.debug("Package '%s' added.", command)
+
+    def upsert_package(self, **kwargs: Any) -> None:
+        """
+        Adds the package, or updates its fields if it already exists.
+
+        An existing package keeps its install_date; last_update is bumped.
+        """
+        kwargs.pop("force", None)
+        now_us = _now_us()
+        values = {**kwargs, "install_date": now_us, "last_update": now_us}
+        stmt = sqlite_insert(PackageModel).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["command"],
+            set_={key: stmt.excluded[key] for key in values if key not in ("command", "install_date")},
+        )
+        with self._session(commit=True) as session:
+            session.execute(stmt)
+        logger.debug("Package '%s' upserted.", kwargs.get("command"))
+
+    def bulk_add_packages(self, rows: List[Mapping[str, Any]]) -> None:
+        """
+        Adds several packages in one transaction with a single executemany.
+        """
+        now_us = _now_us()
+        values = [
+            {**row, "install_date": now_us, "last_update": now_us} for row in rows
+        ]
+        if not values:
+            return
+        with self._session(commit=True) as session:
+            self._insert(session, values, "Package already exists. Use --force to overwrite.")
+        logger.debug("Bulk added %d package(s).", len(values))
 
     def get_package(self, command: str) -> Optional[Dict[str, Any]]:
-        with self.Session() as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
+        return self.read_cache.get(("package_row", command), lambda: self._load_package(command))
+
+    def _load_package(self, command: str) -> Optional[Dict[str, Any]]:
+        with self._session() as session:
+            pkg = session.execute(self._get_stmt, {"command": command}).first()
         return self._pack_package_data(pkg) if pkg else None
 
+    def get_package_with_scripts(self, command: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the package together with its scripts, keyed by script name.
+        """
+        params = {"command": command}
+        with self._session() as session:
+            pkg = session.execute(self._get_stmt, params).first()
+            if not pkg:
+                return None
+            data = self._pack_package_data(pkg)
+            data["scripts"] = {
+                script.script_name: ScriptRegistry._pack_script_data(script)
+                for script in session.execute(ScriptRegistry._by_command_stmt, params)
+            }
+        return data
+
+    def iter_packages(
+        self,
+        command: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        group: Optional[str] = None,
+        active: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields packages matching the filters, fetching rows in batches.
+        """
+        filters, params = self._package_filters(
+            command, name, description, location, group, active
+        )
+        stmt = self._list_statement(filters)
+        # Streaming holds its session open between yields, so it gets its own.
+        with self.Session.session_factory() as session:
+            for row in session.execute(
+                stmt, params, execution_options={"yield_per": YIELD_PER}
+            ):
+                yield self._pack_package_data(row)
+
+    def _package_filters(
+        self,
+        command: Optional[str],
+        name: Optional[str],
+        description: Optional[str],
+        location: Optional[str],
+        group: Optional[str],
+        active: Optional[bool],
+    ) -> tuple:
+        """
+        Returns the (key, mode) filters and bound parameters of a package listing.
+        """
+        filters, params = [], {}
+        if command:
+            filters.append(("command", "eq"))
+            params["command"] = command
+        for key, value in (
+            ("name", name),
+            ("description", description),
+            ("location", location),
+        ):
+            if value:
+                mode, params[key] = self._text_filter(value)
+                filters.append((key, mode))
+        if group:
+            filters.append(("group", "eq"))
+            params["group"] = group
+        if active is not None:
+            filters.append(("active", "eq"))
+            params["active"] = active
+        return tuple(filters), params
+
     def list_packages(
         self,
         command: Optional[str] = None,
@@ -200,69 +887,117 @@ class PackageRegistry(BaseRegistry):
         active: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
         logger.debug("Listing packages with filters.")
-        with session_scope(self.Session) as session:
-            query = session.query(PackageModel)
-            if command:
-                query = query.filter_by(command=command)
-            if name:
-                query = query.filter(PackageModel.name.like(f"%{name}%"))
-            if description:
-                query = query.filter(PackageModel.description.like(f"%{description}%"))
-            if location:
-                query = query.filter(PackageModel.location.like(f"%{location}%"))
-            if group:
-                query = query.filter_by(group=group)
-            if active is not None:
-                query = query.filter_by(active=active)
-            packages = query.all()
-            return [self._pack_package_data(pkg) for pkg in packages]
+        return list(
+            self.iter_packages(
+                command=command,
+                name=name,
+                description=description,
+                location=location,
+                group=group,
+                active=active,
+            )
+        )
+
+    def list_packages_with_scripts(
+        self,
+        command: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+        location: Optional[str] = None,
+        group: Optional[str] = None,
+        active: Optional[bool] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Lists packages matching the filters together with their scripts, keyed
+        by script name, using a single outer join.
+        """
+        filters, params = self._package_filters(
+            command, name, description, location, group, active
+        )
+        key = ("scripts",) + filters
+        stmt = self._list_statements.get(key)
+        if stmt is None:
+            # Scripts share only 'command' with packages, so their other columns
+            # can be selected unlabelled and the row packs as either model.
+            scripts = ScriptModel.__table__
+            stmt = (
+                self._list_statement(filters)
+                .add_columns(*(c for c in scripts.c if c.name != "command"))
+                .outerjoin(scripts, scripts.c.command == PackageModel.command)
+                .order_by(PackageModel.command)
+            )
+            self._list_statements[key] = stmt
+
+        packages = []
+        with self._session() as session:
+            rows = session.execute(stmt, params)
+            for _, package_rows in groupby(rows, key=attrgetter("command")):
+                first = next(package_rows)
+                data = self._pack_package_data(first)
+                data["scripts"] = {
+                    row.script_name: ScriptRegistry._pack_script_data(row)
+                    for row in chain((first,), package_rows)
+                    if row.script_name is not None
+                }
+                packages.append(data)
+        return packages
 
     def update_package(self, command: str, **kwargs: Any) -> None:
-        with session_scope(self.Session) as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
-            if not pkg:
+        valid_columns = {col.name for col in PackageModel.__table__.columns}
+        values: Dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key == "install_date":
+                continue
+            if key in valid_columns:
+                values[key] = value if key != "dependencies" else (value if value else None)
+            else:
+                logger.warning("Key '%s' is not a recognized package field.", key)
+        values["last_update"] = _now_us()
+
+        with self._session(commit=True) as session:
+            result = session.execute(
+                update(PackageModel)
+                .where(PackageModel.command == command)
+                .values(**values)
+            )
+            if result.rowcount == 0:
                 raise ValueError("Package not found")
 
-            valid_columns = {col.name for col in PackageModel.__table__.columns}
-            for key, value in kwargs.items():
-                if key == "install_date":
-                    continue
-                if key in valid_columns:
-                    setattr(
-                        pkg,
-                        key,
-                        value if key != "dependencies" else (value if value else None),
-                    )
-                else:
-                    logger.warning("Key '%s' is not a recognized package field.", key)
-            pkg.last_update = datetime.now()
-
     def delete_package(self, command: str) -> None:
-        with session_scope(self.Session) as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
-            if pkg:
-                session.delete(pkg)
+        with self._session(commit=True) as session:
+            result = session.execute(self._delete_stmt, {"command": command})
+            if result.rowcount:
                 logger.debug("Package '%s' deleted.", command)
 
+    def set_active_bulk(self, commands: Iterable[str], active: bool) -> int:
+        """
+        Sets the active flag of several packages in one transaction.
+
+        Returns the number of packages updated; unknown commands are skipped.
+        """
+        return self._update_many(
+            PackageModel.command, commands, {"active": active}
+        )
+
+    def _set_active(self, command: str, active: bool) -> None:
+        if self.set_active_bulk([command], active) == 0:
+            raise ValueError("Package not found")
+
     def deactivate_package(self, command: str) -> None:
         logger.info("Deactivating package '%s'.", command)
-        with session_scope(self.Session) as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
-            if not pkg:
-                raise ValueError("Package not found")
-            pkg.active = False
+        self._set_active(command, False)
 
     def activate_package(self, command: str) -> None:
-        with session_scope(self.Session) as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
-            if not pkg:
-                raise ValueError("Package not found")
-            pkg.active = True
+        self._set_active(command, True)
 
     def get_package_location(self, command: str) -> Optional[str]:
-        with session_scope(self.Session) as session:
-            pkg = session.query(PackageModel).filter_by(command=command).first()
-            return pkg.location if pkg else None
+        return self.read_cache.get(
+            ("package_location", command), lambda: self._load_package_location(command)
+        )
+
+    def _load_package_location(self, command: str) -> Optional[str]:
+        with self.engine.connect() as conn:
+            return conn.scalar(self._location_stmt, {"command": command})
 
 
 class RepositoryRegistry(BaseRegistry):
@@ -270,41 +1005,102 @@ class RepositoryRegistry(BaseRegistry):
     Manages all repository-related operations.
     """
 
-    def _pack_repo_data(self, repo: RepositoryModel) -> Dict[str, Any]:
-        return {
-            "url": repo.url,
-            "name": repo.name,
-            "branch": repo.branch,
-            "location": repo.location,
-            "auto_sync": repo.auto_sync,
-            "install_date": repo.install_date.isoformat(),
-            "last_update": repo.last_update.isoformat(),
-        }
+    model = RepositoryModel
+
+    # Statements built once and executed with bound parameters. Reads select
+    # plain table columns so rows skip ORM instance construction.
+    _get_stmt = select(*RepositoryModel.__table__.c).where(
+        RepositoryModel.url == bindparam("url")
+    )
+    _by_name_stmt = (
+        select(*RepositoryModel.__table__.c)
+        .where(RepositoryModel.name == bindparam("name"))
+        .limit(1)
+    )
+    _location_stmt = select(RepositoryModel.location).where(
+        RepositoryModel.url == bindparam("url")
+    )
+    _delete_stmt = delete(RepositoryModel).where(RepositoryModel.url == bindparam("url"))
+
+    def _pack_repo_data(self, repo: Any) -> Dict[str, Any]:
+        """Packs a RepositoryModel instance or a repositories table row."""
+        data = dict(zip(REPOSITORY_FIELDS, _get_repository_fields(repo)))
+        data["install_date"] = _isoformat(data["install_date"])
+        data["last_update"] = _isoformat(data["last_update"])
+        return data
 
     def add_repository(self, **kwargs: Any) -> None:
-        now_dt = datetime.now()
-        kwargs.setdefault("install_date", now_dt)
-        kwargs.setdefault("last_update", now_dt)
+        now_us = _now_us()
+        kwargs.setdefault("install_date", now_us)
+        kwargs.setdefault("last_update", now_us)
 
         url = kwargs.get("url")
         force = kwargs.pop("force", False)
 
-        with session_scope(self.Session) as session:
-            existing_repo = session.query(RepositoryModel).filter_by(url=url).first()
-            if existing_repo:
-                if force:
-                    session.delete(existing_repo)
+        with self._session(commit=True) as session:
+            if force:
+                result = session.execute(
+                    delete(RepositoryModel).where(RepositoryModel.url == url)
+                )
+                if result.rowcount:
                     logger.info("Existing repository '%s' deleted.", url)
-                else:
-                    raise ValueError("Repository already exists. Use --force to overwrite.")
-            session.add(RepositoryModel(**kwargs))
+            self._insert(
+                session, kwargs, "Repository already exists. Use --force to overwrite."
+            )
             logger.debug("Repository '%s' added.", url)
 
+    def bulk_add_repositories(self, rows: List[Mapping[str, Any]]) -> None:
+        """
+        Adds several repositories in one transaction with a single executemany.
+        """
+        now_us = _now_us()
+        values = [
+            {"install_date": now_us, "last_update": now_us, **row} for row in rows
+        ]
+        if not values:
+            return
+        with self._session(commit=True) as session:
+            self._insert(session, values, "Repository already exists. Use --force to overwrite.")
+        logger.debug("Bulk added %d repositories.", len(values))
+
     def get_repository(self, url: str) -> Optional[Dict[str, Any]]:
-        with self.Session() as session:
-            repo = session.query(RepositoryModel).filter_by(url=url).first()
+        return self.read_cache.get(("repository", url), lambda: self._load_repository(url))
+
+    def _load_repository(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._session() as session:
+            repo = session.execute(self._get_stmt, {"url": url}).first()
             return self._pack_repo_data(repo) if repo else None
 
+    def iter_repositories(
+        self,
+        url: Optional[str] = None,
+        name: Optional[str] = None,
+        branch: Optional[str] = None,
+        location: Optional[str] = None,
+        auto_sync: Optional[bool] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields repositories matching the filters, fetching rows in batches.
+        """
+        filters, params = [], {}
+        if url:
+            filters.append(("url", "eq"))
+            params["url"] = url
+        for key, value in (("name", name), ("branch", branch), ("location", location)):
+            if value:
+                filters.append((key, "like"))
+                params[key] = f"%{value}%"
+        if auto_sync is not None:
+            filters.append(("auto_sync", "eq"))
+            params["auto_sync"] = auto_sync
+        stmt = self._list_statement(tuple(filters))
+        # Streaming holds its session open between yields, so it gets its own.
+        with self.Session.session_factory() as session:
+            for row in session.execute(
+                stmt, params, execution_options={"yield_per": YIELD_PER}
+            ):
+                yield self._pack_repo_data(row)
+
     def list_repositories(
         self,
         url: Optional[str] = None,
@@ -313,57 +1109,64 @@ class RepositoryRegistry(BaseRegistry):
         location: Optional[str] = None,
         auto_sync: Optional[bool] = None,
     ) -> List[Dict[str, Any]]:
-        with session_scope(self.Session) as session:
-            query = session.query(RepositoryModel)
-            if url:
-                query = query.filter_by(url=url)
-            if name:
-                query = query.filter(RepositoryModel.name.like(f"%{name}%"))
-            if branch:
-                query = query.filter(RepositoryModel.branch.like(f"%{branch}%"))
-            if location:
-                query = query.filter(RepositoryModel.location.like(f"%{location}%"))
-            if auto_sync is not None:
-                query = query.filter_by(auto_sync=auto_sync)
-            repos = query.all()
-            return [self._pack_repo_data(repo) for repo in repos]
+        return list(
+            self.iter_repositories(
+                url=url, name=name, branch=branch, location=location, auto_sync=auto_sync
+            )
+        )
 
     def update_repository(self, url: str, **kwargs: Any) -> None:
-        with session_scope(self.Session) as session:
-            repo = session.query(RepositoryModel).filter_by(url=url).first()
-            if not repo:
+        valid_columns = {col.name for col in RepositoryModel.__table__.columns}
+        values: Dict[str, Any] = {}
+        for key, value in kwargs.items():
+            if key in valid_columns:
+                values[key] = value
+            else:
+                logger.warning("Key '%s' is not a recognized repository field.", key)
+        values["last_update"] = _now_us()
+
+        with self._session(commit=True) as session:
+            result = session.execute(
+                update(RepositoryModel).where(RepositoryModel.url == url).values(**values)
+            )
+            if result.rowcount == 0:
                 raise ValueError("Repository not found")
-            valid_columns = {col.name for col in RepositoryModel.__table__.columns}
-            for key, value in kwargs.items():
-                if key in valid_columns:
-                    setattr(repo, key, value)
-                else:
-                    logger.warning(
-                        "Key '%s' is not a recognized repository field.", key
-                    )
-            repo.last_update = datetime.now()
 
     def delete_repository(self, url: str) -> None:
-        with session_scope(self.Session) as session:
-            repo = session.query(RepositoryModel).filter_by(url=url).first()
-            if repo:
-                session.delete(repo)
+        with self._session(commit=True) as session:
+            session.execute(self._delete_stmt, {"url": url})
+
+    def set_auto_sync_bulk(self, urls: Iterable[str], auto_sync: bool) -> int:
+        """
+        Sets the auto-sync flag of several repositories in one transaction.
+
+        Returns the number of repositories updated; unknown URLs are skipped.
+        """
+        return self._update_many(
+            RepositoryModel.url, urls, {"auto_sync": auto_sync}
+        )
 
     def set_auto_sync(self, url: str, auto_sync: bool) -> None:
-        with session_scope(self.Session) as session:
-            repo = session.query(RepositoryModel).filter_by(url=url).first()
-            if not repo:
-                raise ValueError("Repository not found")
-            repo.auto_sync = auto_sync
+        if self.set_auto_sync_bulk([url], auto_sync) == 0:
+            raise ValueError("Repository not found")
 
     def get_repo_location(self, url: str) -> Optional[str]:
-        with session_scope(self.Session) as session:
-            repo = session.query(RepositoryModel).filter_by(url=url).first()
-            return repo.location if repo else None
+        return self.read_cache.get(
+            ("repository_location", url), lambda: self._load_repo_location(url)
+        )
+
+    def _load_repo_location(self, url: str) -> Optional[str]:
+        with self.engine.connect() as conn:
+            return conn.scalar(self._location_stmt, {"url": url})
 
     def get_repo_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        with session_scope(self.Session) as session:
-            repo = session.query(RepositoryModel).filter_by(name=name).first()
+        return self.read_cache.get(
+            ("repository_name", name), lambda: self._load_repo_by_name(name)
+        )
+
+    def _load_repo_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._session() as session:
+            repo = session.execute(self._by_name_stmt, {"name": name}).first()
             return self._pack_repo_data(repo) if repo else None
 
 
@@ -381,46 +1184,62 @@ class RegistryManager:
         self.script_registry = ScriptRegistry(self.engine)
         self.package_registry = PackageRegistry(self.engine)
         self.repository_registry = RepositoryRegistry(self.engine)
+        self.read_cache = get_read_cache(self.engine)
+
+    def _is_empty(self) -> bool:
+        """Returns True when none of the registry tables hold a row."""
+        stmt = select(*(exists().select_from(t) for t in Base.metadata.sorted_tables))
+        with self.engine.connect() as conn:
+            return not any(conn.execute(stmt).one())
 
     def reset_registry(self) -> None:
-        """Drops and recreates registry tables."""
+        """Drops and recreates registry tables, unless they are already empty."""
+        if self._is_empty():
+            logger.debug("Registry is already empty; skipping reset.")
+            return
+        drop_search_index(self.engine)
         Base.metadata.drop_all(self.engine)
         Base.metadata.create_all(self.engine)
+        self.package_registry.search_index = create_search_index(self.engine)
+        self.read_cache.clear()
         logger.info("Registry tables dropped and recreated.")
 
-    def register_package(self, pkg: Dict[str, Any], force: bool = False) -> None:
+    def register_package(self, pkg: Mapping[str, Any], force: bool = False) -> None:
+        """
+        Registers a package and its scripts. The manifest is only read, so a
+        shared read-only mapping may be passed as is.
+        """
         logger.info("Registering package: %s", pkg.get("command"))
-        scripts = pkg.pop("scripts", {})
-        for script_name, script in scripts.items():
-            self.script_registry.add_script(pkg["command"], script_name, script, force=force)
-        self.package_registry.add_package(**pkg)
-        
-    def update_package(self, pkg: Dict[str, Any]) -> None:
+        scripts = pkg.get("scripts", {})
+        package_data = {k: v for k, v in pkg.items() if k != "scripts"}
+        # Package and scripts go in together: one executemany per table, one commit.
+        # The package row comes first since the scripts reference it.
+        with self.package_registry._session(commit=True) as session:
+            self.package_registry.insert_package(session, **package_data)
+            self.script_registry.insert_scripts(session, pkg["command"], scripts, force=force)
+
+    def update_package(self, pkg: Mapping[str, Any]) -> None:
         logger.info("Updating package: %s", pkg.get("command"))
-        scripts = pkg.pop("scripts", {})
+        scripts = pkg.get("scripts", {})
         command = pkg.get("command")
         if not command:
             raise ValueError("Missing package 'command' field for update.")
-        update_data = {k: v for k, v in pkg.items() if k != "command"}
+        update_data = {k: v for k, v in pkg.items() if k not in ("command", "scripts")}
         self.package_registry.update_package(command, **update_data)
         for script_name, script in scripts.items():
             self.script_registry.update_script(command, script_name, script)
 
     def unregister_package(self, command: str) -> None:
         logger.info("Unregistering package: %s", command)
+        # The package's scripts are removed by the ON DELETE CASCADE.
         self.package_registry.delete_package(command)
-        for script in self.script_registry.list_scripts(command):
-            self.script_registry.delete_script(script["command"], script["script_name"])
 
     def retrieve_package(self, command: str) -> Optional[Dict[str, Any]]:
         logger.debug("Retrieving package: %s", command)
-        pkg = self.package_registry.get_package(command)
-        if pkg:
-            pkg["scripts"] = {
-                script["script_name"]: script
-                for script in self.script_registry.list_scripts(command)
-            }
-        return pkg
+        return self.read_cache.get(
+            ("package", command),
+            lambda: self.package_registry.get_package_with_scripts(command),
+        )
 
     def list_packages(
         self,
@@ -1,49 +1,151 @@
 # devt/models.py
+from datetime import datetime
+from functools import lru_cache
+import json
+from pathlib import Path
 import logging
-from sqlalchemy import Boolean, Column, String, Text, DateTime, JSON
+from sqlalchemy import BigInteger, Boolean, Column, ForeignKey, Index, String, Text
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 Base = declarative_base()
 
+
+def dump_json(value):
+    """
+    Encodes a value the way FastJSON stores it; None stays NULL.
+    """
+    if value is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value)
+
+
+class FastJSON(TypeDecorator):
+    """
+    JSON column stored as text, encoded and decoded with orjson when available.
+
+    The stored format is plain JSON text, so rows written by the generic JSON
+    type remain readable.
+    """
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return dump_json(value)
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return None
+        if orjson is not None:
+            return orjson.loads(value)
+        return json.loads(value)
+
+
+class EpochDateTime(TypeDecorator):
+    """
+    Datetime column stored as integer Unix microseconds.
+
+    Rows written by the former DateTime column hold ISO strings; those are
+    still parsed on read.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, int):
+            return value
+        return round(value.timestamp() * 1_000_000)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return datetime.fromisoformat(value)
+        return _from_epoch_us(int(value))
+
+
+@lru_cache(maxsize=4096)
+def _from_epoch_us(value: int) -> datetime:
+    """
+    Converts Unix microseconds to a local datetime. Packages installed together
+    share timestamps, so listings mostly hit the cache.
+    """
+    seconds, micros = divmod(value, 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros)
+
+
+class PathType(TypeDecorator):
+    """
+    Filesystem path stored as its normalized string form.
+
+    Accepts str or Path on write and returns the stored str on read, so packed
+    rows need no per-row Path round-trip.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return str(Path(value))
+
+
 class ScriptModel(Base):
     __tablename__ = "scripts"
-    # Composite primary key: (command, script_name)
-    command = Column(String, primary_key=True)
-    script_name = Column(String, primary_key=True)
-    args = Column(JSON, nullable=False)
-    cwd = Column(String, nullable=False)
-    env = Column(JSON, nullable=True)
+    # Composite primary key: (command, script_name). Scripts go away with their package.
+    command = Column(
+        String(128), ForeignKey("packages.command", ondelete="CASCADE"), primary_key=True
+    )
+    script_name = Column(String(128), primary_key=True)
+    args = Column(FastJSON, nullable=False)
+    cwd = Column(PathType, nullable=False)
+    env = Column(FastJSON, nullable=True)
     shell = Column(String, nullable=True)
-    kwargs = Column(JSON, nullable=True)
+    kwargs = Column(FastJSON, nullable=True)
 
     def __repr__(self) -> str:
         return f"<ScriptModel(command={self.command}, script_name={self.script_name})>"
 
 class PackageModel(Base):
     __tablename__ = "packages"
-    command = Column(String, primary_key=True)  # Unique identifier
-    name = Column(String, nullable=False)
+    # Backs the group/active filters of list_packages; script lookups by command
+    # are already served by the leading column of the scripts primary key.
+    __table_args__ = (Index("ix_packages_group_active", "group", "active"),)
+    command = Column(String(128), primary_key=True)  # Unique identifier
+    name = Column(String(128), nullable=False)
     description = Column(Text, nullable=True)
-    location = Column(String, nullable=False)
-    dependencies = Column(JSON, nullable=True)
-    group = Column(String, nullable=True)
+    location = Column(PathType, nullable=False)
+    dependencies = Column(FastJSON, nullable=True)
+    group = Column(String(64), nullable=True)
     active = Column(Boolean, nullable=False, default=True)
-    install_date = Column(DateTime, nullable=False)
-    last_update = Column(DateTime, nullable=False)
+    install_date = Column(EpochDateTime, nullable=False)
+    last_update = Column(EpochDateTime, nullable=False)
 
     def __repr__(self) -> str:
         return f"<PackageModel(command={self.command}, name={self.name})>"
 
 class RepositoryModel(Base):
     __tablename__ = "repositories"
+    # Backs get_repo_by_name.
+    __table_args__ = (Index("ix_repositories_name", "name"),)
     url = Column(String, primary_key=True)  # Unique identifier
     name = Column(String, nullable=False)
     branch = Column(String, nullable=True)
-    location = Column(String, nullable=False)
+    location = Column(PathType, nullable=False)
     auto_sync = Column(Boolean, nullable=False, default=False)
-    install_date = Column(DateTime, nullable=False)
-    last_update = Column(DateTime, nullable=False)
+    install_date = Column(EpochDateTime, nullable=False)
+    last_update = Column(EpochDateTime, nullable=False)
 
     def __repr__(self) -> str:
         return f"<RepositoryModel(url={self.url}, name={self.name})>"
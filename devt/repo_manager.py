@@ -9,18 +9,61 @@ Provides a RepoManager class to add, sync, and remove repositories in a dedicate
 similarly to how local directories are handled.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from pathlib import Path
 import shutil
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
-from git import Repo
 from devt.constants import USER_REGISTRY_DIR
 from devt.utils import force_remove, on_exc
 
 logger = logging.getLogger(__name__)
 
 
+def _git(*args: str, repo_dir: Optional[Path] = None, check: bool = True) -> subprocess.CompletedProcess:
+    """
+    Run a git command, optionally inside repo_dir, and capture its output.
+
+    Raises RuntimeError carrying git's stderr when check is set and git fails.
+    """
+    cmd = ["git", "-C", str(repo_dir), *args] if repo_dir else ["git", *args]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result
+
+
+def _is_dirty(repo_dir: Path) -> bool:
+    """Whether tracked files differ from HEAD, staged or not."""
+    return bool(_git("status", "--porcelain", "--untracked-files=no", repo_dir=repo_dir).stdout)
+
+
+def _has_branch(repo_dir: Path, branch: str) -> bool:
+    """Whether a local branch exists, without enumerating every ref."""
+    result = _git(
+        "show-ref", "--verify", "--quiet", f"refs/heads/{branch}", repo_dir=repo_dir, check=False
+    )
+    return result.returncode == 0
+
+
+def _head_state(repo_dir: Path) -> tuple[str, str, bool]:
+    """
+    Return the current branch, the HEAD commit and whether the clone is shallow.
+
+    All three come from a single rev-parse call instead of one git process each.
+    """
+    shallow, sha, branch = _git(
+        "rev-parse", "--is-shallow-repository", "HEAD", "--abbrev-ref", "HEAD", repo_dir=repo_dir
+    ).stdout.split()
+    if branch == "HEAD":
+        raise RuntimeError(f"HEAD is detached in {repo_dir}; no branch to update")
+    return branch, sha, shallow == "true"
+
+
 class RepoManager:
     """
     Manages repositories stored in a dedicated repos folder.
@@ -43,6 +86,17 @@ class RepoManager:
             "Initialized RepoManager with repos directory at: %s", self.repos_dir
         )
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def get(cls) -> "RepoManager":
+        """
+        Return the shared RepoManager, creating the repos folder on first use.
+
+        RepoManager holds no per-caller state, so services share one instance
+        instead of repeating the directory setup.
+        """
+        return cls()
+
     def _get_repo_name(self, repo_url: str) -> str:
         """Extracts a repository name from its URL."""
         return Path(urlparse(repo_url).path).stem
@@ -85,29 +139,32 @@ class RepoManager:
             raise FileNotFoundError(f"Repository directory does not exist: {repo_dir}")
 
         try:
-            repo = Repo(repo_dir)
-            if repo.is_dirty():
+            if _is_dirty(repo_dir):
                 logger.warning(
                     "Repository %s is dirty. Resetting to a clean state...",
                     repo_dir.name,
                 )
-                repo.git.reset("--hard")
+                _git("reset", "--hard", repo_dir=repo_dir)
 
-            available_branches = {b.name for b in repo.branches}
-            if branch and branch in available_branches:
-                repo.git.checkout(branch)
+            if branch and _has_branch(repo_dir, branch):
+                _git("checkout", branch, repo_dir=repo_dir)
             elif branch:
                 logger.warning(
                     "Branch '%s' does not exist. Updating the current branch instead.",
                     branch,
                 )
 
-            current_branch = repo.active_branch.name
-            commit_before = repo.head.commit.hexsha
+            current_branch, commit_before, shallow = _head_state(repo_dir)
 
             logger.info("Updating repository %s...", repo_dir.name)
-            repo.remotes.origin.pull()
-            commit_after = repo.head.commit.hexsha
+            if shallow:
+                # A pull would merge into, and deepen, the shallow history;
+                # fetch only the new tip and move the branch onto it instead.
+                _git("fetch", "--depth", "1", "origin", current_branch, repo_dir=repo_dir)
+                _git("reset", "--hard", "FETCH_HEAD", repo_dir=repo_dir)
+            else:
+                _git("pull", "origin", repo_dir=repo_dir)
+            commit_after = _git("rev-parse", "HEAD", repo_dir=repo_dir).stdout.strip()
             changes_made = commit_before != commit_after
 
             if changes_made:
@@ -120,13 +177,84 @@ class RepoManager:
             logger.error("Failed to update repository at %s: %s", repo_dir, e)
             raise ValueError(f"Failed to update repository at {repo_dir}: {e}")
 
-    def add_repo(self, repo_url: str, branch: str = None, force: bool = False) -> tuple[Path, str]:
+    @staticmethod
+    def _run_concurrently(
+        func: Callable[[str], Any], items: List[str], max_workers: int
+    ) -> Dict[str, tuple[Any, Optional[Exception]]]:
+        """
+        Call func on every item on a thread pool and pair each result with its error.
+
+        Each call is its own git process waiting on the network, so running them
+        side by side overlaps that latency. Failures are collected rather than
+        raised, so one failing item does not stop the others.
+        """
+        if not items:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            futures = {item: executor.submit(func, item) for item in items}
+        outcomes: Dict[str, tuple[Any, Optional[Exception]]] = {}
+        for item, future in futures.items():
+            error = future.exception()
+            if error is not None:
+                logger.error("Failed to process repository %s: %s", item, error)
+            outcomes[item] = (None if error else future.result(), error)
+        return outcomes
+
+    def sync_all(
+        self, repo_identifiers: List[str], max_workers: int = 8
+    ) -> Dict[str, tuple[Optional[Path], Optional[str], bool, Optional[Exception]]]:
+        """
+        Update several repositories concurrently.
+
+        Args:
+            repo_identifiers (List[str]): Repository names, local paths, or URLs.
+            max_workers (int, optional): Maximum number of concurrent updates. Defaults to 8.
+
+        Returns:
+            Dict[str, tuple]: For each identifier, the local path, the effective branch,
+                              whether changes were made, and the error if the update failed.
+        """
+        outcomes = self._run_concurrently(self.sync_repo, repo_identifiers, max_workers)
+        return {
+            identifier: (*(result or (None, None, False)), error)
+            for identifier, (result, error) in outcomes.items()
+        }
+
+    def add_all(
+        self, repo_urls: List[str], branch: str = None, force: bool = False, max_workers: int = 8
+    ) -> Dict[str, tuple[Optional[Path], Optional[str], Optional[Exception]]]:
+        """
+        Clone or update several repositories concurrently.
+
+        Args:
+            repo_urls (List[str]): The URLs of the repositories.
+            branch (str, optional): The branch to clone or update. Defaults to None.
+            force (bool, optional): Re-clone repositories that already exist. Defaults to False.
+            max_workers (int, optional): Maximum number of concurrent clones. Defaults to 8.
+
+        Returns:
+            Dict[str, tuple]: For each URL, the local path, the effective branch,
+                              and the error if cloning or updating failed.
+        """
+        outcomes = self._run_concurrently(
+            lambda url: self.add_repo(url, branch=branch, force=force), repo_urls, max_workers
+        )
+        return {
+            url: (*(result or (None, None)), error)
+            for url, (result, error) in outcomes.items()
+        }
+
+    def add_repo(
+        self, repo_url: str, branch: str = None, force: bool = False, depth: Optional[int] = 1
+    ) -> tuple[Path, str]:
         """
         Add a repository by cloning it if not already added or updating it if it exists.
 
         Args:
             repo_url (str): The URL of the repository.
             branch (str, optional): The branch to clone or update. Defaults to None.
+            depth (int, optional): History depth of a new clone, limited to the cloned
+                                   branch. Pass None for a full clone. Defaults to 1.
 
         Returns:
             tuple[Path, str]: The local path to the repository and the effective branch.
@@ -148,8 +276,11 @@ class RepoManager:
             return updated_dir, current_branch
 
         logger.info("Cloning repository %s...", repo_url)
-        repo = Repo.clone_from(repo_url, repo_dir, branch=branch)
-        return repo_dir, repo.active_branch.name
+        clone_args = ["--branch", branch] if branch else []
+        if depth:
+            clone_args += ["--depth", str(depth), "--single-branch"]
+        _git("clone", *clone_args, "--", repo_url, str(repo_dir))
+        return repo_dir, _head_state(repo_dir)[0]
 
     def remove_repo(self, repo_url: str) -> bool:
         """
@@ -177,13 +308,13 @@ class RepoManager:
             bool: True if the branch was checked out successfully, False otherwise.
         """
 
+        repo_dir = Path(repo_dir)
         try:
-            repo = Repo(repo_dir)
-            if repo.is_dirty():
+            if _is_dirty(repo_dir):
                 logger.info("Repository %s is dirty. Resetting to a clean state...", repo_dir.name)
-                repo.git.reset("--hard")
-            if branch in {b.name for b in repo.branches}:
-                repo.git.checkout(branch)
+                _git("reset", "--hard", repo_dir=repo_dir)
+            if _has_branch(repo_dir, branch):
+                _git("checkout", branch, repo_dir=repo_dir)
                 logger.info("Checked out branch '%s' in repository %s", branch, repo_dir.name)
                 return True
             logger.error("Branch '%s' does not exist in repository %s", branch, repo_dir.name)
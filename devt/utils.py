@@ -8,6 +8,8 @@ Provides functions for loading and saving JSON files, setting user environment v
 resolving relative paths, and determining the source type of a path.
 """
 
+from collections import deque
+from functools import lru_cache
 import json
 import logging
 import os
@@ -17,10 +19,20 @@ import shutil
 from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
-from jsonschema import ValidationError, validate
 import typer
 import yaml
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+# Use the libyaml-backed loader and dumper when PyYAML was built with them.
+try:
+    from yaml import CDumper as YamlDumper, CSafeLoader as YamlSafeLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML
+    from yaml import Dumper as YamlDumper, SafeLoader as YamlSafeLoader
+
 from devt.constants import USER_REGISTRY_DIR, WORKSPACE_REGISTRY_DIR
 
 # from InquirerPy import inquirer
@@ -92,17 +104,34 @@ def resolve_rel_path(base_dir: Path, rel_path: str) -> Path:
     return resolved
 
 
+def _loads_json(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_json(data: Any, indent: Union[int, None] = 2) -> bytes:
+    """Serialize to UTF-8 JSON bytes; orjson only handles no indent or indent=2."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=indent).encode("utf-8")
+
+
 def load_json(file_path: Path) -> dict:
     logger.debug("Loading JSON file: %s", file_path)
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            data = json.load(file)
+        with open(file_path, "rb") as file:
+            data = _loads_json(file.read())
             logger.debug("Successfully loaded JSON from: %s", file_path)
             return data
     except FileNotFoundError:
         logger.error("JSON file not found: %s", file_path)
         return {}
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         logger.error("Error decoding JSON in %s: %s", file_path, e)
         return {}
 
@@ -111,30 +140,13 @@ def save_json(file_path: Path, data: dict, indent: Union[int, None] = 2) -> None
     logger.debug("Saving JSON to file: %s", file_path)
     file_path.parent.mkdir(parents=True, exist_ok=True)
     try:
-        with open(file_path, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=indent)
+        with open(file_path, "wb") as file:
+            file.write(_dumps_json(data, indent))
             logger.debug("JSON successfully saved to: %s", file_path)
     except IOError as e:
         logger.error("Error writing JSON to %s: %s", file_path, e)
 
 
-def find_file_type(prefix: str, current_dir: Path = Path.cwd()) -> Optional[Path]:
-    """
-    Search for a file with the specified prefix and common file extensions (.json, .cjson, .yaml, .yml)
-    in the provided directory.
-    Returns the path to the file if found, otherwise None.
-    """
-    logger.debug("Searching for file with prefix '%s' in: %s", prefix, current_dir)
-    for ext in ["yaml", "yml", "json", "cjson"]:
-        candidate_file = current_dir / f"{prefix}.{ext}"
-        logger.debug("Checking candidate: %s", candidate_file)
-        if candidate_file.exists():
-            logger.debug("Found candidate: %s", candidate_file)
-            return candidate_file
-    logger.warning("No file found for prefix '%s' in: %s", prefix, current_dir)
-    return None
-
-
 def load_manifest(manifest_path: Path) -> Dict[str, Any]:
     """Load and parse the manifest file (YAML or JSON)."""
     if not manifest_path.is_file():
@@ -147,11 +159,11 @@ def load_manifest(manifest_path: Path) -> Dict[str, Any]:
             raise FileNotFoundError("Manifest file not found.")
 
     logger.debug("Loading manifest file: %s", manifest_path)
-    with manifest_path.open("r", encoding="utf-8") as f:
+    with manifest_path.open("rb") as f:
         if manifest_path.suffix in [".yaml", ".yml"]:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlSafeLoader)
         elif manifest_path.suffix in [".json", ".cjson"]:
-            data = json.load(f)
+            data = _loads_json(f.read())
         else:
             logger.error("Unsupported file extension: %s", manifest_path.suffix)
             raise ValueError(f"Unsupported file extension: {manifest_path.suffix}")
@@ -171,14 +183,17 @@ def save_manifest(manifest_dir: Path, data: Dict[str, Any], type: str = "yaml")
     manifest_dir.mkdir(exist_ok=True)
     manifest_file = manifest_dir / f"manifest.{type}"
     logger.debug("Saving manifest to: %s", manifest_file)
-    with manifest_file.open("w", encoding="utf-8") as f:
-        if type == "yaml":
-            yaml.dump(data, f, default_flow_style=False)
-        elif type == "json":
-            json.dump(data, f, indent=2)
+    if type == "json":
+        manifest_file.write_bytes(_dumps_json(data, indent=2))
+    else:
+        with manifest_file.open("w", encoding="utf-8") as f:
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False)
     logger.debug("Manifest saved to: %s", manifest_file)
 
 
+MANIFEST_FILE_NAMES = frozenset({"manifest.yaml", "manifest.yml", "manifest.json"})
+
+
 def find_recursive_manifest_files(
     current_dir: Path = Path.cwd(), max_depth: int = 3
 ) -> List[Path]:
@@ -192,15 +207,21 @@ def find_recursive_manifest_files(
         max_depth,
     )
     manifest_files = []
-    for path in current_dir.rglob("*"):
-        if path.is_file() and path.name in [
-            "manifest.yaml",
-            "manifest.yml",
-            "manifest.json",
-        ]:
-            if len(path.relative_to(current_dir).parts) <= max_depth:
-                logger.debug("Found manifest file: %s", path)
-                manifest_files.append(path)
+    # Breadth-first, so directories below max_depth are never listed at all.
+    pending = deque([(current_dir, 1)])
+    while pending:
+        directory, depth = pending.popleft()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in MANIFEST_FILE_NAMES and entry.is_file():
+                        path = Path(entry.path)
+                        logger.debug("Found manifest file: %s", path)
+                        manifest_files.append(path)
+                    elif depth < max_depth and entry.is_dir(follow_symlinks=False):
+                        pending.append((Path(entry.path), depth + 1))
+        except OSError as e:
+            logger.debug("Skipping unreadable directory %s: %s", directory, e)
     logger.info("Total manifest files found: %d", len(manifest_files))
     return manifest_files
 
@@ -217,22 +238,24 @@ def merge_configs(*configs: Dict[str, Any]) -> Dict[str, Any]:
         if not config:
             logger.debug("Skipping empty configuration source.")
             continue
+        # Most sources have no None values and no nested dict to merge, so
+        # they can be applied with a single update instead of key by key.
+        if not any(
+            value is None or (isinstance(value, dict) and isinstance(result.get(key), dict))
+            for key, value in config.items()
+        ):
+            result.update(config)
+            continue
         for key, value in config.items():
             if value is None:
                 logger.debug("Skipping key '%s' with None value.", key)
                 continue
-            if (
-                key in result
-                and isinstance(result[key], dict)
-                and isinstance(value, dict)
-            ):
-                merged = result[key].copy()
-                merged.update(value)
-                result[key] = merged
+            current = result.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                result[key] = {**current, **value}
                 logger.debug("Merged dictionaries for key '%s'.", key)
             else:
                 result[key] = value
-                logger.debug("Set config key '%s' to '%s'.", key, value)
     return result
 
 
@@ -251,14 +274,32 @@ def get_execute_args(manifest_path: Path) -> Tuple[Path, Dict[str, Any]]:
     return base_dir, merged
 
 
+# macOS and Windows filesystems match file names case-insensitively by default.
+_fold_file_name = (
+    str.casefold if platform.system() in ("Darwin", "Windows") else (lambda name: name)
+)
+
+
 def find_file_type(file_type: str, current_dir: Path = Path.cwd()) -> Optional[Path]:
     """
     Check if a workspace file (.json, .cjson, .yaml, .yml) exists in the current directory.
     Returns the path to the workspace file if found, otherwise None.
     """
+    # List the directory once rather than probing each extension separately.
+    try:
+        with os.scandir(current_dir) as entries:
+            names = {_fold_file_name(entry.name) for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except PermissionError:
+        # Unlistable but traversable directories can still be probed by name.
+        names = None
     for ext in ["yaml", "yml", "json", "cjson"]:
         workspace_file = current_dir / f"{file_type}.{ext}"
-        if workspace_file.exists():
+        if names is None:
+            if workspace_file.exists():
+                return workspace_file
+        elif _fold_file_name(workspace_file.name) in names:
             return workspace_file
     return None
 
@@ -312,16 +353,48 @@ MANIFEST_SCHEMA = {
     "required": ["name", "command", "scripts"],
 }
 
+@lru_cache(maxsize=None)
+def _manifest_validators() -> Tuple[Any, Any]:
+    """
+    Build the manifest validators once, on first use.
+
+    jsonschema is slow to import and most commands never validate a manifest,
+    so it is imported here rather than at module load. When fastjsonschema is
+    installed, the schema is also compiled into a plain Python function.
+    """
+    from jsonschema import Draft7Validator
+
+    Draft7Validator.check_schema(MANIFEST_SCHEMA)
+    try:
+        import fastjsonschema
+    except ImportError:  # pragma: no cover - optional speedup
+        fast_validate = None
+    else:
+        fast_validate = fastjsonschema.compile(MANIFEST_SCHEMA)
+    return fast_validate, Draft7Validator(MANIFEST_SCHEMA)
+
 
 def validate_manifest(manifest: dict) -> bool:
     logger.debug("Validating manifest: %s", manifest)
-    try:
-        validate(instance=manifest, schema=MANIFEST_SCHEMA)
-        logger.debug("Manifest validated successfully.")
-        return True
-    except ValidationError as e:
-        logger.error("Manifest validation error: %s", e)
+    fast_validate, validator = _manifest_validators()
+    if fast_validate is not None:
+        from fastjsonschema import JsonSchemaException
+
+        try:
+            fast_validate(manifest)
+            logger.debug("Manifest validated successfully.")
+            return True
+        except JsonSchemaException:
+            # Fall through to jsonschema for its more detailed error message.
+            pass
+    from jsonschema.exceptions import best_match
+
+    error = best_match(validator.iter_errors(manifest))
+    if error is not None:
+        logger.error("Manifest validation error: %s", error)
         return False
+    logger.debug("Manifest validated successfully.")
+    return True
 
 
 def print_table(
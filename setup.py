@@ -5,7 +5,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     include_package_data=True,
-    install_requires=["typer", "GitPython", "jsonschema"],
+    install_requires=["typer", "jsonschema"],
     entry_points={
         "console_scripts": [
             "devt=devt.cli:app",